@@ -60,63 +60,63 @@ export default function Collection() {
     setAvailableNames(list.map((a) => a.title ?? "").filter(Boolean)); // set the names true/false if available
   }, [artworks, setAvailableNames]);
 
+  // lowercase the searchable fields once per fetch rather than on every keystroke
+  const indexed = useMemo(
+    () =>
+      (artworks ?? []).map((art: Artwork) => ({
+        art,
+        titleKey: (art.title ?? "").toLowerCase(), // also used as the sort key
+        acquiredAt: art.date_acquired ? new Date(art.date_acquired).getTime() : null, // parsed once for the date filter
+        fields: [
+          art.title ?? "",
+          art.artist_name ?? "",
+          art.location_acquired ?? "",
+          art.date_acquired ?? "",
+          art.medium ?? "",
+          String(art.width_cm ?? ""),
+          String(art.height_cm ?? ""),
+          String(art.depth_cm ?? ""),
+        ].map((f) => f.toLowerCase()),
+      })),
+    [artworks]
+  );
+
   // filter
   const filtered = useMemo(() => {
-    const list = artworks ?? [];
     const q = debouncedQuery.trim().toLowerCase();
 
     // text filtering first
     let result = q
-      ? list.filter((art: Artwork) => {
-        const t = (art.title ?? "").toLowerCase();
-        const an = (art.artist_name ?? "").toLowerCase();
-        const la = (art.location_acquired ?? "").toLowerCase();
-        const da = (art.date_acquired ?? "").toLowerCase();
-        const md = (art.medium ?? "").toLowerCase();
-        const wd = (String(art.width_cm ?? "")).toLowerCase();
-        const hd = (String(art.height_cm ?? "")).toLowerCase();
-        const d = (String(art.depth_cm ?? "")).toLowerCase();
-        return (
-          t.includes(q) ||
-          an.includes(q) ||
-          la.includes(q) ||
-          da.includes(q) ||
-          md.includes(q) ||
-          wd.includes(q) ||
-          hd.includes(q) ||
-          d.includes(q)
-        );
-      })
-      : list;
+      ? indexed.filter((row) => row.fields.some((f) => f.includes(q)))
+      : indexed;
 
     // name filter
     if (filters.names.length > 0) {
       const namesSet = new Set(filters.names);
-      result = result.filter((a) => (a.title ? namesSet.has(a.title) : false)); // filter by selected names only
+      result = result.filter(({ art }) => (art.title ? namesSet.has(art.title) : false)); // filter by selected names only
     }
 
     // date acquired filter
     if (filters.acquiredFrom || filters.acquiredTo) {
-      const from = filters.acquiredFrom ? new Date(filters.acquiredFrom) : null;
-      const to = filters.acquiredTo ? new Date(filters.acquiredTo) : null;
-      result = result.filter((a) => {
-        if (!a.date_acquired) return false;
-        const d = new Date(a.date_acquired);
-        if (from && d < from) return false; // before from date
-        if (to && d > to) return false; // after to date
+      const from = filters.acquiredFrom ? new Date(filters.acquiredFrom).getTime() : null;
+      const to = filters.acquiredTo ? new Date(filters.acquiredTo).getTime() : null;
+      result = result.filter(({ acquiredAt }) => {
+        if (acquiredAt === null) return false;
+        if (from !== null && acquiredAt < from) return false; // before from date
+        if (to !== null && acquiredAt > to) return false; // after to date
         return true;
       });
     }
 
     // sort using old logic
-    return [...result].sort((a, b) => {
-      const titleA = (a.title ?? "").toLowerCase();
-      const titleB = (b.title ?? "").toLowerCase();
-      if (titleA < titleB) return sortOrder === "asc" ? -1 : 1;
-      if (titleA > titleB) return sortOrder === "asc" ? 1 : -1;
-      return 0;
-    });
-  }, [artworks, debouncedQuery, sortOrder, filters]);
+    return [...result]
+      .sort((a, b) => {
+        if (a.titleKey < b.titleKey) return sortOrder === "asc" ? -1 : 1;
+        if (a.titleKey > b.titleKey) return sortOrder === "asc" ? 1 : -1;
+        return 0;
+      })
+      .map(({ art }) => art);
+  }, [indexed, debouncedQuery, sortOrder, filters]);
 
   return (
     <main>